@@ -4,14 +4,23 @@ Loads and validates configuration from YAML file.
 """
 
 import os
+import copy
+import json
+import hashlib
 import logging
 import yaml
 from typing import Dict, Any, Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built against it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class ConfigManager:
     """Manages application configuration."""
 
+    # Bump when merge or validation logic changes to invalidate cached configs
+    CACHE_VERSION = 1
+
     DEFAULT_CONFIG = {
         'gemini': {
             'api_key': '',
@@ -47,6 +56,10 @@ class ConfigManager:
             config_path: Path to configuration file
         """
         self.config_path = config_path
+        self.cache_path = config_path + '.cache'
+        self._cache_defaults_hash = hashlib.sha256(
+            json.dumps(self.DEFAULT_CONFIG, sort_keys=True).encode('utf-8')
+        ).hexdigest()
         self.config = {}
         self.logger = logging.getLogger(__name__)
 
@@ -67,16 +80,25 @@ class ConfigManager:
                 f"Please copy config.yaml and add your Gemini API key."
             )
 
+        st = os.stat(self.config_path)
+        cached = self._load_cache(st)
+        if cached is not None:
+            self.config = cached
+            self.logger.info("Configuration loaded from cache")
+            return self.config
+
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                self.config = yaml.load(f, Loader=_YAML_LOADER)
 
             # Merge with defaults
-            self.config = self._merge_with_defaults(self.config, self.DEFAULT_CONFIG)
+            self.config = self._merge_with_defaults(self.config, copy.deepcopy(self.DEFAULT_CONFIG))
 
             # Validate
             self._validate()
 
+            self._save_cache(st)
+
             self.logger.info("Configuration loaded successfully")
             return self.config
 
@@ -85,23 +107,59 @@ class ConfigManager:
         except Exception as e:
             raise ValueError(f"Failed to load configuration: {str(e)}")
 
-    def _merge_with_defaults(self, config: Dict, defaults: Dict) -> Dict:
-        """Merge configuration with defaults."""
-        result = defaults.copy()
+    def _load_cache(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached configuration if it matches the file on disk."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception:
+            return None
 
+        if not isinstance(entry, dict) or entry.get('key') != self._cache_key(st):
+            return None
+
+        config = entry.get('config')
+        return config if isinstance(config, dict) else None
+
+    def _save_cache(self, st: os.stat_result):
+        """Cache the validated configuration, readable only by the owner."""
+        try:
+            data = json.dumps({'key': self._cache_key(st), 'config': self.config})
+
+            # JSON turns non-string keys into strings; a cache hit must return
+            # the same config as a fresh parse
+            if json.loads(data)['config'] != self.config:
+                self.logger.debug("Configuration does not round-trip through JSON, not caching")
+                return
+
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # The mode above only applies when the file is created
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except Exception as e:
+            self.logger.debug(f"Failed to write configuration cache: {str(e)}")
+
+    def _cache_key(self, st: os.stat_result) -> list:
+        """Identify the config file state and the code that produced the cache."""
+        return [self.CACHE_VERSION, self._cache_defaults_hash, st.st_mtime_ns, st.st_size]
+
+    def _merge_with_defaults(self, config: Dict, defaults: Dict) -> Dict:
+        """Merge configuration into defaults in place and return defaults."""
         for key, value in config.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_with_defaults(value, result[key])
+            current = defaults.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                self._merge_with_defaults(value, current)
             else:
-                result[key] = value
+                defaults[key] = value
 
-        return result
+        return defaults
 
     def _validate(self):
         """Validate configuration."""
-        # Check API key
-        api_key = self.config.get('gemini', {}).get('api_key', '')
-        if not api_key or api_key == 'YOUR_GEMINI_API_KEY_HERE':
+        # Check API key (real keys are well over 20 characters)
+        api_key = self.config['gemini'].get('api_key') or ''
+        if not isinstance(api_key, str) or len(api_key) < 20 or api_key == 'YOUR_GEMINI_API_KEY_HERE':
             raise ValueError(
                 "Gemini API key not configured.\n"
                 "Please add your API key to config.yaml.\n"
@@ -109,7 +167,7 @@ class ConfigManager:
             )
 
         # Validate rate limit
-        rpm = self.config.get('rate_limit', {}).get('requests_per_minute', 0)
+        rpm = self.config['rate_limit'].get('requests_per_minute', 0)
         if rpm <= 0 or rpm > 60:
             raise ValueError("requests_per_minute must be between 1 and 60")
 
@@ -4,43 +4,57 @@ Handles API calls, rate limiting, and prompt engineering.
 """
 
 import time
+import array
+import hashlib
 import logging
-from typing import Optional, Dict
-from collections import deque
-import google.generativeai as genai
+from typing import Optional, Dict, Iterator
+from collections import OrderedDict
+
+
+class StreamInterruptedError(Exception):
+    """Raised when a streamed response fails after part of it was yielded."""
 
 
 class GeminiClient:
     """Client for interacting with Google Gemini API."""
 
-    # Prompt templates for different modes
+    # Prompt templates for different modes, split around the text as (prefix, suffix)
     PROMPTS = {
-        "grammar_fix": """Fix any grammar, spelling, and punctuation errors in the following text.
+        "grammar_fix": ("""Fix any grammar, spelling, and punctuation errors in the following text.
 Maintain the original tone and style. Only return the corrected text, nothing else.
 
-Text: {text}""",
+Text: """, ""),
 
-        "formal": """Rewrite the following text in a more formal and professional style.
+        "formal": ("""Rewrite the following text in a more formal and professional style.
 Maintain the core message. Only return the rewritten text, nothing else.
 
-Text: {text}""",
+Text: """, ""),
 
-        "casual": """Rewrite the following text in a more casual and friendly style.
+        "casual": ("""Rewrite the following text in a more casual and friendly style.
 Maintain the core message. Only return the rewritten text, nothing else.
 
-Text: {text}""",
+Text: """, ""),
 
-        "simplify": """Simplify the following text to make it clearer and easier to understand.
+        "simplify": ("""Simplify the following text to make it clearer and easier to understand.
 Use simpler words and shorter sentences. Only return the simplified text, nothing else.
 
-Text: {text}""",
+Text: """, ""),
 
-        "expand": """Expand and elaborate on the following text with more detail and context.
+        "expand": ("""Expand and elaborate on the following text with more detail and context.
 Maintain the original style. Only return the expanded text, nothing else.
 
-Text: {text}"""
+Text: """, "")
     }
 
+    GENERATION_CONFIG = {
+        "temperature": 0.3,  # Lower temperature for more consistent corrections
+        "max_output_tokens": 2048,
+    }
+
+    # Response cache bounds
+    CACHE_MAX_ENTRIES = 512
+    CACHE_MAX_RESPONSE_CHARS = 8192
+
     def __init__(self, api_key: str, model: str = "gemini-2.0-flash-exp",
                  requests_per_minute: int = 50, max_retries: int = 3,
                  timeout: int = 10):
@@ -58,36 +72,86 @@ Text: {text}"""
         self.max_retries = max_retries
         self.timeout = timeout
 
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        # Gemini SDK is loaded on first use, see the model property
+        self._api_key = api_key
+        self.model_name = model
+        self._model = None
 
         # Rate limiting setup
         self.requests_per_minute = requests_per_minute
-        self.request_times = deque(maxlen=requests_per_minute)
+        # Ring buffer of request timestamps, sized to a power of two so the
+        # index can wrap with a mask
+        size = 1 << max(requests_per_minute - 1, 0).bit_length()
+        self._rt = array.array('d', [0.0] * size)
+        self._mask = size - 1
+        self._head = 0  # Next slot to write
+        self._count = 0  # Requests recorded, capped at requests_per_minute
+
+        # LRU cache of responses keyed by (mode, text digest)
+        self._cache = OrderedDict()
+
+        # Prompt builders, one per mode
+        self._prompt_fns = {
+            mode: self._compile_prompt_fn(prefix, suffix)
+            for mode, (prefix, suffix) in self.PROMPTS.items()
+        }
 
-        self.logger.info(f"Gemini client initialized with model: {model}")
+        self.logger.info("Gemini client initialized with model: %s", model)
 
-    def _check_rate_limit(self):
-        """Check and enforce rate limiting."""
-        now = time.time()
+    @staticmethod
+    def _compile_prompt_fn(prefix: str, suffix: str):
+        """
+        Generate a one-argument function that wraps text in a prompt.
 
-        # Remove requests older than 1 minute
-        while self.request_times and now - self.request_times[0] > 60:
-            self.request_times.popleft()
+        The prefix and suffix are embedded as constants in the generated code,
+        so building a prompt is a single string concatenation.
 
-        # If at limit, wait
-        if len(self.request_times) >= self.requests_per_minute:
-            wait_time = 60 - (now - self.request_times[0])
-            if wait_time > 0:
-                self.logger.warning(f"Rate limit reached. Waiting {wait_time:.2f}s")
+        Args:
+            prefix: Prompt text before the user's text
+            suffix: Prompt text after the user's text
+
+        Returns:
+            Function taking the user's text and returning the full prompt
+        """
+        expr = f"{prefix!r} + t"
+        if suffix:
+            expr += f" + {suffix!r}"
+
+        namespace = {}
+        exec(compile(f"def _p(t): return {expr}", '<prompt>', 'exec'), namespace)
+        return namespace['_p']
+
+    @property
+    def model(self):
+        """Gemini model, configured on first access."""
+        if self._model is None:
+            # Deferred because importing the SDK pulls in grpc and protobuf
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+            self._model = genai.GenerativeModel(self.model_name)
+            self.logger.debug("Gemini SDK loaded")
+        return self._model
+
+    def _check_rate_limit(self):
+        """Check and enforce rate limiting."""
+        # Only the request made requests_per_minute calls ago matters
+        if self._count == self.requests_per_minute:
+            oldest = self._rt[(self._head - self.requests_per_minute) & self._mask]
+            elapsed = time.monotonic() - oldest
+            if elapsed < 60:
+                wait_time = 60 - elapsed
+                self.logger.warning("Rate limit reached. Waiting %.2fs", wait_time)
                 time.sleep(wait_time)
+        else:
+            self._count += 1
 
-        self.request_times.append(time.time())
+        self._rt[self._head] = time.monotonic()
+        self._head = (self._head + 1) & self._mask
 
     def improve_text(self, text: str, mode: str = "grammar_fix") -> Optional[str]:
         """
-        Improve text using Gemini API.
+        Improve text using Gemini API, returning the complete response.
 
         Args:
             text: Text to improve
@@ -96,51 +160,123 @@ Text: {text}"""
         Returns:
             Improved text or None if failed
         """
+        try:
+            improved_text = "".join(self.improve_text_stream(text, mode))
+        except StreamInterruptedError as e:
+            self.logger.error("Failed to improve text: %s", e)
+            return None
+
+        return improved_text or None
+
+    def improve_text_stream(self, text: str, mode: str = "grammar_fix") -> Iterator[str]:
+        """
+        Improve text using Gemini API, yielding the response as it is generated.
+
+        Leading and trailing whitespace of the full response is dropped. Once a
+        chunk has been yielded a failed request is not retried, since the
+        caller has already consumed part of the output.
+
+        Args:
+            text: Text to improve
+            mode: Improvement mode (grammar_fix, formal, casual, simplify, expand)
+
+        Yields:
+            Chunks of improved text
+
+        Raises:
+            StreamInterruptedError: If the request fails after output was yielded
+        """
         if not text or not text.strip():
             self.logger.warning("Empty text provided")
-            return None
+            return
 
         if mode not in self.PROMPTS:
-            self.logger.error(f"Invalid mode: {mode}")
-            return None
+            self.logger.error("Invalid mode: %s", mode)
+            return
+
+        # Serve repeated requests from cache
+        cache_key = self._cache_key(text, mode)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            self.logger.info("Using cached response (%s)", mode)
+            yield cached
+            return
+
+        # Load the SDK up front so a broken install is not retried as an API error
+        try:
+            model = self.model
+        except Exception as e:
+            self.logger.error("Failed to load Gemini SDK: %s", e)
+            return
 
         # Apply rate limiting
         self._check_rate_limit()
 
         # Build prompt
-        prompt = self.PROMPTS[mode].format(text=text)
+        prompt = self._prompt_fns[mode](text)
 
         # Retry logic
         for attempt in range(self.max_retries):
+            parts = []
             try:
-                self.logger.debug(f"Sending request (attempt {attempt + 1}/{self.max_retries})")
+                self.logger.debug("Sending streaming request (attempt %d/%d)", attempt + 1, self.max_retries)
 
-                response = self.model.generate_content(
+                response = model.generate_content(
                     prompt,
-                    generation_config={
-                        "temperature": 0.3,  # Lower temperature for more consistent corrections
-                        "max_output_tokens": 2048,
-                    }
+                    stream=True,
+                    generation_config=self.GENERATION_CONFIG
                 )
 
-                if response.text:
-                    improved_text = response.text.strip()
-                    self.logger.info(f"Successfully improved text ({mode})")
-                    return improved_text
+                # Hold back trailing whitespace until more text follows it
+                held = ""
+                for chunk in response:
+                    piece = held + chunk.text
+                    if not parts:
+                        piece = piece.lstrip()
+                    content = piece.rstrip()
+                    held = piece[len(content):]
+                    if content:
+                        parts.append(content)
+                        yield content
+
+                if parts:
+                    self._cache_response(cache_key, "".join(parts))
+                    self.logger.info("Successfully improved text (%s)", mode)
+                    return
                 else:
                     self.logger.warning("Empty response from Gemini")
 
             except Exception as e:
-                self.logger.error(f"API error (attempt {attempt + 1}): {str(e)}")
+                self.logger.error("API error (attempt %d): %s", attempt + 1, e)
+
+                if parts:
+                    raise StreamInterruptedError(
+                        f"Stream interrupted after {sum(map(len, parts))} characters: {str(e)}"
+                    ) from e
 
                 if attempt < self.max_retries - 1:
                     # Exponential backoff
                     wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time}s...")
+                    self.logger.info("Retrying in %ds...", wait_time)
                     time.sleep(wait_time)
 
         self.logger.error("All retry attempts failed")
-        return None
+
+    @staticmethod
+    def _cache_key(text: str, mode: str) -> tuple:
+        """Build the response cache key for a text and mode."""
+        return (mode, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+
+    def _cache_response(self, key: tuple, text: str):
+        """Store a response in the LRU cache, evicting the oldest entry if full."""
+        if len(text) > self.CACHE_MAX_RESPONSE_CHARS:
+            return
+
+        self._cache[key] = text
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
     def get_available_modes(self) -> Dict[str, str]:
         """
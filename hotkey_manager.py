@@ -12,19 +12,21 @@ from pynput import keyboard
 class HotkeyManager:
     """Manages global hotkeys for the writing assistant."""
 
-    # Mapping of config keys to pynput keys
+    # Mapping of config modifier names to pynput hotkey tokens
     KEY_MAPPING = {
-        'cmd': keyboard.Key.cmd,
-        'ctrl': keyboard.Key.ctrl,
-        'alt': keyboard.Key.alt,
-        'option': keyboard.Key.alt,
-        'shift': keyboard.Key.shift,
+        'cmd': '<cmd>',
+        'ctrl': '<ctrl>',
+        'alt': '<alt>',
+        'option': '<alt>',
+        'shift': '<shift>',
     }
 
     def __init__(self):
         """Initialize hotkey manager."""
         self.logger = logging.getLogger(__name__)
         self.hotkeys = {}
+        self._press_fns = []  # Bound HotKey.press methods
+        self._release_fns = []  # Bound HotKey.release methods
         self.listener = None
         self.is_running = False
 
@@ -38,39 +40,59 @@ class HotkeyManager:
             mode: Mode name for the callback
         """
         try:
-            # Parse hotkey string
-            parts = hotkey_str.lower().replace(' ', '').split('+')
-            modifiers = set()
-            key = None
-
-            for part in parts:
-                if part in self.KEY_MAPPING:
-                    modifiers.add(self.KEY_MAPPING[part])
-                else:
-                    # Regular key
-                    key = keyboard.KeyCode.from_char(part)
-
-            if key is None:
-                self.logger.error(f"No key specified in hotkey: {hotkey_str}")
-                return
-
             # Create hotkey combination
             hotkey = keyboard.HotKey(
-                keyboard.HotKey.parse(hotkey_str.replace('cmd', '<cmd>').replace('option', '<alt>')),
+                keyboard.HotKey.parse(self._normalize_hotkey(hotkey_str)),
                 lambda m=mode: callback(m)
             )
 
+            # Drop a previous registration of the same hotkey
+            previous = self.hotkeys.get(hotkey_str)
+            if previous:
+                self._press_fns.remove(previous['hotkey'].press)
+                self._release_fns.remove(previous['hotkey'].release)
+
             self.hotkeys[hotkey_str] = {
                 'hotkey': hotkey,
                 'callback': callback,
                 'mode': mode
             }
+            self._press_fns.append(hotkey.press)
+            self._release_fns.append(hotkey.release)
 
             self.logger.info(f"Registered hotkey: {hotkey_str} -> {mode}")
 
         except Exception as e:
             self.logger.error(f"Failed to register hotkey {hotkey_str}: {str(e)}")
 
+    def _normalize_hotkey(self, hotkey_str: str) -> str:
+        """
+        Convert a config hotkey string to pynput's hotkey syntax.
+
+        Args:
+            hotkey_str: Hotkey string (e.g., "cmd+shift+g" or "ctrl+esc")
+
+        Returns:
+            Hotkey string for keyboard.HotKey.parse (e.g., "<cmd>+<shift>+g")
+
+        Raises:
+            ValueError: If no non-modifier key is specified
+        """
+        tokens = []
+        has_key = False
+        for part in hotkey_str.lower().replace(' ', '').split('+'):
+            if part in self.KEY_MAPPING:
+                tokens.append(self.KEY_MAPPING[part])
+            else:
+                # Named keys such as "esc" or "tab" need angle brackets
+                tokens.append(part if len(part) == 1 or part.startswith('<') else f'<{part}>')
+                has_key = True
+
+        if not has_key:
+            raise ValueError(f"No key specified in hotkey: {hotkey_str}")
+
+        return '+'.join(tokens)
+
     def start(self):
         """Start listening for hotkeys."""
         if self.is_running:
@@ -111,18 +133,20 @@ class HotkeyManager:
     def _on_press(self, key):
         """Handle key press events."""
         try:
-            for hotkey_data in self.hotkeys.values():
-                hotkey_data['hotkey'].press(self.listener.canonical(key))
+            canonical_key = self.listener.canonical(key)
+            for press in self._press_fns:
+                press(canonical_key)
         except Exception as e:
-            self.logger.error(f"Error in key press handler: {str(e)}")
+            self.logger.error("Error in key press handler: %s", e)
 
     def _on_release(self, key):
         """Handle key release events."""
         try:
-            for hotkey_data in self.hotkeys.values():
-                hotkey_data['hotkey'].release(self.listener.canonical(key))
+            canonical_key = self.listener.canonical(key)
+            for release in self._release_fns:
+                release(canonical_key)
         except Exception as e:
-            self.logger.error(f"Error in key release handler: {str(e)}")
+            self.logger.error("Error in key release handler: %s", e)
 
     def register_multiple_hotkeys(self, hotkey_config: Dict[str, str], callback: Callable):
         """
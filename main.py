@@ -16,13 +16,16 @@ License: MIT
 
 import os
 import sys
+import time
 import logging
 import signal
 import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Optional
 
 from config_manager import ConfigManager
-from gemini_client import GeminiClient
+from gemini_client import GeminiClient, StreamInterruptedError
 from text_handler import TextHandler
 from hotkey_manager import HotkeyManager
 
@@ -30,6 +33,9 @@ from hotkey_manager import HotkeyManager
 class WritingAssistant:
     """Main application class for the writing assistant."""
 
+    # Repeated presses of the same hotkey within this window are collapsed
+    DEBOUNCE_SECONDS = 0.2
+
     def __init__(self, config_path: str = 'config.yaml'):
         """
         Initialize writing assistant.
@@ -43,7 +49,11 @@ class WritingAssistant:
         self.text_handler = None
         self.hotkey_manager = None
         self.is_running = False
-        self.processing_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._pending = OrderedDict()  # mode -> time queued
+        self._last_press = {}  # mode -> time of last accepted press
+        self._jobs_ready = threading.Condition(threading.Lock())
+        self._worker = None
 
     def setup_logging(self):
         """Configure logging."""
@@ -106,14 +116,44 @@ class WritingAssistant:
         """
         Handle hotkey press.
 
+        Queues the request for the worker thread so the listener thread
+        stays responsive while the API call is in flight. Presses of a mode
+        that is already queued, or that arrive within the debounce window,
+        are collapsed into a single request.
+
         Args:
             mode: Improvement mode (grammar_fix, formal, etc.)
         """
-        # Prevent concurrent processing
-        if not self.processing_lock.acquire(blocking=False):
-            self.logger.warning("Already processing a request, ignoring hotkey")
-            return
+        now = time.monotonic()
+        with self._jobs_ready:
+            if mode in self._pending:
+                return
+            if now - self._last_press.get(mode, float('-inf')) < self.DEBOUNCE_SECONDS:
+                return
+
+            self._last_press[mode] = now
+            self._pending[mode] = now
+            self._jobs_ready.notify()
+
+    def _process_jobs(self):
+        """Worker loop that processes queued hotkey requests one at a time."""
+        while True:
+            with self._jobs_ready:
+                while not self._pending and not self._shutdown.is_set():
+                    self._jobs_ready.wait()
+                if self._shutdown.is_set():
+                    return
+                mode, _ = self._pending.popitem(last=False)
+
+            self._process_hotkey(mode)
 
+    def _process_hotkey(self, mode: str):
+        """
+        Capture, improve and replace the selected text.
+
+        Args:
+            mode: Improvement mode (grammar_fix, formal, etc.)
+        """
         try:
             self.logger.info(f"Hotkey triggered: {mode}")
 
@@ -138,13 +178,23 @@ class WritingAssistant:
 
             self.logger.info(f"Processing {len(selected_text)} characters")
 
-            # Improve text using Gemini
-            improved_text = self.gemini_client.improve_text(selected_text, mode)
-
-            if improved_text:
-                # Replace text
-                success = self.text_handler.replace_selected_text(improved_text)
+            # Improve text using Gemini, pasting the first chunk over the
+            # selection and inserting the rest as it streams in
+            chunks = self.gemini_client.improve_text_stream(selected_text, mode)
+            try:
+                success = self._insert_streamed_text(chunks)
+            except StreamInterruptedError as e:
+                # The selection was already replaced with part of the response
+                self.logger.error("Text only partly replaced: %s", e)
+                if self.config_manager.should_show_notifications():
+                    self.text_handler.show_notification(
+                        "Writing Assistant",
+                        "Text only partly replaced, press Cmd+Z to undo",
+                        duration=2
+                    )
+                return
 
+            if success is not None:
                 if success:
                     self.logger.info("Text replaced successfully")
                     if self.config_manager.should_show_notifications():
@@ -179,8 +229,30 @@ class WritingAssistant:
                     duration=2
                 )
 
-        finally:
-            self.processing_lock.release()
+    def _insert_streamed_text(self, chunks) -> Optional[bool]:
+        """
+        Replace the selection with streamed text.
+
+        Args:
+            chunks: Iterator of improved text chunks
+
+        Returns:
+            None if no text was produced, otherwise whether insertion succeeded
+
+        Raises:
+            StreamInterruptedError: If the stream fails after the first chunk
+        """
+        first_chunk = next(chunks, None)
+        if not first_chunk:
+            return None
+
+        if not self.text_handler.replace_selected_text(first_chunk):
+            return False
+
+        for chunk in chunks:
+            if not self.text_handler.insert_text(chunk):
+                return False
+        return True
 
     def start(self):
         """Start the writing assistant."""
@@ -190,6 +262,9 @@ class WritingAssistant:
 
         try:
             self.logger.info("Starting hotkey listener...")
+            self._shutdown.clear()
+            self._worker = threading.Thread(target=self._process_jobs, daemon=True)
+            self._worker.start()
             self.hotkey_manager.start()
             self.is_running = True
 
@@ -216,7 +291,7 @@ class WritingAssistant:
 
             # Keep running
             signal.signal(signal.SIGINT, self._signal_handler)
-            signal.pause()
+            self._shutdown.wait()
 
         except Exception as e:
             self.logger.error(f"Error starting assistant: {str(e)}")
@@ -235,6 +310,11 @@ class WritingAssistant:
             if self.hotkey_manager:
                 self.hotkey_manager.stop()
 
+            # Wake the worker so it can exit
+            self._shutdown.set()
+            with self._jobs_ready:
+                self._jobs_ready.notify_all()
+
             self.is_running = False
             self.logger.info("Writing assistant stopped")
             print("✅ Stopped successfully\n")
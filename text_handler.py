@@ -1,6 +1,6 @@
 """
 Text capture and replacement for macOS.
-Uses AppleScript and clipboard to capture and replace selected text.
+Uses synthesized keyboard events and clipboard to capture and replace selected text.
 """
 
 import time
@@ -8,15 +8,57 @@ import logging
 import subprocess
 from typing import Optional
 import Cocoa
+import Quartz
 
 
 class TextHandler:
     """Handles text capture and replacement on macOS."""
 
+    # Virtual key codes (kVK_ANSI_C, kVK_ANSI_V)
+    KEY_CODE_C = 8
+    KEY_CODE_V = 9
+
+    # Maximum UTF-16 code units a single keyboard event can carry
+    UNICODE_EVENT_MAX_CHARS = 20
+
     def __init__(self):
         """Initialize text handler."""
         self.logger = logging.getLogger(__name__)
         self.clipboard_delay = 0.1  # Delay for clipboard operations
+        self.clipboard_poll_interval = 0.005  # Poll interval while waiting for a copy
+
+        # Pre-built Cmd+C / Cmd+V key events
+        self._copy_events = self._create_command_events(self.KEY_CODE_C)
+        self._paste_events = self._create_command_events(self.KEY_CODE_V)
+
+        # Shared system pasteboard
+        self._pb = Cocoa.NSPasteboard.generalPasteboard()
+
+        # Notification center (None when not running from an app bundle)
+        self._nc = Cocoa.NSUserNotificationCenter.defaultUserNotificationCenter()
+
+    @staticmethod
+    def _create_command_events(key_code: int) -> tuple:
+        """
+        Create key down/up events for a Command+key shortcut.
+
+        Args:
+            key_code: Virtual key code
+
+        Returns:
+            Tuple of (key down, key up) events
+        """
+        events = []
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, key_code, key_down)
+            Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+            events.append(event)
+        return tuple(events)
+
+    def _post_events(self, events: tuple):
+        """Post keyboard events to the system event stream."""
+        for event in events:
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
     def get_selected_text(self) -> Optional[str]:
         """
@@ -27,24 +69,23 @@ class TextHandler:
         """
         try:
             # Save current clipboard
-            pasteboard = Cocoa.NSPasteboard.generalPasteboard()
+            pasteboard = self._pb
             old_clipboard = pasteboard.stringForType_(Cocoa.NSPasteboardTypeString)
 
             # Copy selected text (Cmd+C)
-            self._execute_applescript('''
-                tell application "System Events"
-                    keystroke "c" using command down
-                end tell
-            ''')
+            change_count = pasteboard.changeCount()
+            self._post_events(self._copy_events)
 
-            # Wait for clipboard to update
-            time.sleep(self.clipboard_delay)
+            # Wait for clipboard to update; no change means nothing was copied
+            if not self._wait_for_pasteboard_change(change_count):
+                self.logger.warning("No text selected")
+                return None
 
             # Get new clipboard content
             new_clipboard = pasteboard.stringForType_(Cocoa.NSPasteboardTypeString)
 
-            # Restore old clipboard
-            if old_clipboard:
+            # Restore old clipboard, unless the copy left it unchanged
+            if old_clipboard is not None and new_clipboard != old_clipboard:
                 pasteboard.clearContents()
                 pasteboard.setString_forType_(old_clipboard, Cocoa.NSPasteboardTypeString)
 
@@ -75,26 +116,20 @@ class TextHandler:
                 return False
 
             # Save current clipboard
-            pasteboard = Cocoa.NSPasteboard.generalPasteboard()
+            pasteboard = self._pb
             old_clipboard = pasteboard.stringForType_(Cocoa.NSPasteboardTypeString)
 
             # Set new text to clipboard
             pasteboard.clearContents()
             pasteboard.setString_forType_(new_text, Cocoa.NSPasteboardTypeString)
 
-            time.sleep(self.clipboard_delay)
-
             # Paste (Cmd+V)
-            self._execute_applescript('''
-                tell application "System Events"
-                    keystroke "v" using command down
-                end tell
-            ''')
+            self._post_events(self._paste_events)
 
             time.sleep(self.clipboard_delay)
 
             # Restore old clipboard
-            if old_clipboard:
+            if old_clipboard is not None and old_clipboard != new_text:
                 pasteboard.clearContents()
                 pasteboard.setString_forType_(old_clipboard, Cocoa.NSPasteboardTypeString)
 
@@ -105,6 +140,80 @@ class TextHandler:
             self.logger.error(f"Failed to replace text: {str(e)}")
             return False
 
+    def _wait_for_pasteboard_change(self, change_count: int) -> bool:
+        """
+        Wait until the pasteboard changes, up to clipboard_delay.
+
+        Args:
+            change_count: Pasteboard change count before the operation
+
+        Returns:
+            True if the pasteboard changed, False on timeout
+        """
+        deadline = time.monotonic() + self.clipboard_delay
+        while self._pb.changeCount() == change_count:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.clipboard_poll_interval)
+        return True
+
+    def insert_text(self, text: str) -> bool:
+        """
+        Insert text at the cursor.
+
+        Single-line text is typed directly. Text containing line breaks is
+        pasted through the clipboard instead, because apps such as chat
+        clients may act on typed newlines (e.g. send on Return) rather than
+        inserting them; pasted line breaks are treated as plain text.
+
+        Args:
+            text: Text to insert
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if '\n' in text or '\r' in text:
+            return self.replace_selected_text(text)
+        return self.type_text(text)
+
+    def type_text(self, text: str) -> bool:
+        """
+        Type text at the cursor without touching the clipboard.
+
+        Use insert_text for text that may contain line breaks.
+
+        Args:
+            text: Text to type
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Split on UTF-16 code units, keeping surrogate pairs together
+            units = text.encode('utf-16-le')
+            step = self.UNICODE_EVENT_MAX_CHARS * 2
+            start = 0
+            while start < len(units):
+                end = min(start + step, len(units))
+                if end < len(units) and 0xD8 <= units[end - 1] <= 0xDB:
+                    end -= 2
+                piece = units[start:end].decode('utf-16-le')
+                start = end
+
+                for key_down in (True, False):
+                    event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+                    Quartz.CGEventKeyboardSetUnicodeString(event, len(piece.encode('utf-16-le')) // 2, piece)
+                    # Clear modifiers the user may still be holding from the hotkey
+                    Quartz.CGEventSetFlags(event, 0)
+                    Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+            self.logger.debug("Typed %d characters", len(text))
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to type text: {str(e)}")
+            return False
+
     def _execute_applescript(self, script: str) -> Optional[str]:
         """
         Execute AppleScript.
@@ -143,10 +252,17 @@ class TextHandler:
             duration: Display duration in seconds
         """
         try:
-            script = f'''
-                display notification "{message}" with title "{title}" sound name "Glass"
-            '''
-            self._execute_applescript(script)
+            if self._nc is not None:
+                notif = Cocoa.NSUserNotification.alloc().init()
+                notif.setTitle_(title)
+                notif.setInformativeText_(message)
+                notif.setSoundName_("Glass")
+                self._nc.deliverNotification_(notif)
+            else:
+                script = f'''
+                    display notification "{message}" with title "{title}" sound name "Glass"
+                '''
+                self._execute_applescript(script)
             self.logger.debug(f"Showed notification: {title}")
 
         except Exception as e: